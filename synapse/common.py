@@ -41,6 +41,7 @@ majmin = (major, minor)
 version = (major, minor, micro)
 
 guidre = regex.compile('^[0-9a-f]{32}$')
+guidchars = frozenset('0123456789abcdef')
 
 novalu = NoValu()
 
@@ -126,7 +127,7 @@ def uhex(text):
     return binascii.unhexlify(text)
 
 def isguid(text):
-    return guidre.match(text) is not None
+    return len(text) == 32 and guidchars.issuperset(text)
 
 def intify(x):
     '''
@@ -635,7 +636,7 @@ def enbase64(b):
     return base64.b64encode(b).decode('utf8')
 
 def debase64(b):
-    return base64.b64decode(b.encode('utf8'))
+    return base64.b64decode(b)
 
 def makedirs(path, mode=0o777):
     os.makedirs(path, mode=mode, exist_ok=True)
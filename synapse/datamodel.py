@@ -422,7 +422,6 @@ class Model:
         self.propsbytype = collections.defaultdict(list) # name: Prop()
         self.arraysbytype = collections.defaultdict(list)
 
-        self._type_pends = collections.defaultdict(list)
         self._modeldef = {
             'ctors': [],
             'types': [],
@@ -3361,7 +3361,7 @@ class Function(AstNode):
 
         # join args and kwargs together...
         real_args = {}
-        for name, arg in s_common.iterzip(argdefs, args, fillvalue=s_common.novalu):
+        for name, arg in itertools.zip_longest(argdefs, args, fillvalue=s_common.novalu):
             if arg is s_common.novalu:
                 break
             if name is s_common.novalu:
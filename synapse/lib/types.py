@@ -242,7 +242,7 @@ class Type:
         return cmpr
 
     def _ctorCmprIn(self, vals):
-        norms = [self.norm(v)[0] for v in vals]
+        norms = [n for (n, i) in self.normMany(vals)]
 
         def cmpr(valu):
             return valu in norms
@@ -296,6 +296,19 @@ class Type:
 
         return func(valu)
 
+    def normMany(self, valus):
+        '''
+        Normalize a list of values for the given type.
+
+        Args:
+            valus (list): The values to normalize.
+
+        Returns:
+            (list): A list of (norm, info) tuples in the same order.
+        '''
+        norm = self.norm
+        return [norm(v) for v in valus]
+
     def repr(self, norm):
         '''
         Return a printable representation for the value.
@@ -352,6 +365,9 @@ class Type:
         topt.update(opts)
         return self.__class__(self.modl, self.name, self.info, topt)
 
+booltrue = frozenset(('true', 't', 'y', 'yes', 'on'))
+boolfalse = frozenset(('false', 'f', 'n', 'no', 'off'))
+
 class Bool(Type):
 
     stortype = s_layer.STOR_TYPE_U8
@@ -368,10 +384,10 @@ class Bool(Type):
             return int(bool(ival)), {}
 
         sval = valu.lower().strip()
-        if sval in ('true', 't', 'y', 'yes', 'on'):
+        if sval in booltrue:
             return 1, {}
 
-        if sval in ('false', 'f', 'n', 'no', 'off'):
+        if sval in boolfalse:
             return 0, {}
 
         raise s_exc.BadTypeValu(name=self.name, valu=valu,
@@ -429,8 +445,7 @@ class Array(Type):
         adds = []
         norms = []
 
-        for item in valu:
-            norm, info = self.arraytype.norm(item)
+        for norm, info in self.arraytype.normMany(valu):
             adds.extend(info.get('adds', ()))
             norms.append(norm)
 
@@ -471,15 +486,25 @@ class Comp(Type):
 
         fields = self.opts.get('fields', ())
 
+        # field names and types are kept as parallel tuples
+        self.fieldnames = tuple(n for (n, t) in fields)
+
         # calc and save field offsets...
-        self.fieldoffs = {n: i for (i, (n, t)) in enumerate(fields)}
+        self.fieldoffs = {n: i for (i, n) in enumerate(self.fieldnames)}
 
         self.tcache = FieldHelper(self.modl, self.name, fields)
 
+        # field types may not exist yet, so resolve them on first use
+        self.fieldtypes = None
+
+    def _getFieldTypes(self):
+        if self.fieldtypes is None:
+            self.fieldtypes = tuple(self.tcache[n] for n in self.fieldnames)
+        return self.fieldtypes
+
     def _normPyTuple(self, valu):
 
-        fields = self.opts.get('fields')
-        if len(fields) != len(valu):
+        if len(self.fieldnames) != len(valu):
             raise s_exc.BadTypeValu(name=self.name, valu=valu,
                                     mesg='invalid number of fields given for norming')
 
@@ -487,18 +512,21 @@ class Comp(Type):
         adds = []
         norms = []
 
-        for i, (name, _) in enumerate(fields):
-
-            _type = self.tcache[name]
+        for name, _type, fval in zip(self.fieldnames, self._getFieldTypes(), valu):
 
-            norm, info = _type.norm(valu[i])
+            norm, info = _type.norm(fval)
 
             subs[name] = norm
             norms.append(norm)
 
-            for k, v in info.get('subs', {}).items():
-                subs[f'{name}:{k}'] = v
-            adds.extend(info.get('adds', ()))
+            fsubs = info.get('subs')
+            if fsubs:
+                for k, v in fsubs.items():
+                    subs[f'{name}:{k}'] = v
+
+            fadds = info.get('adds')
+            if fadds:
+                adds.extend(fadds)
 
         norm = tuple(norms)
         return norm, {'subs': subs, 'adds': adds}
@@ -508,12 +536,7 @@ class Comp(Type):
 
     def repr(self, valu):
 
-        vals = []
-        fields = self.opts.get('fields')
-
-        for valu, (name, _) in zip(valu, fields):
-            rval = self.tcache[name].repr(valu)
-            vals.append(rval)
+        vals = [t.repr(v) for t, v in zip(self._getFieldTypes(), valu)]
 
         if self.sepr is not None:
             return self.sepr.join(vals)
@@ -566,16 +589,17 @@ class Guid(Type):
 
     def _normPyStr(self, valu):
 
+        # check the common case of an actual guid first
+        valu = valu.lower()
+        if len(valu) == 32 and s_common.guidchars.issuperset(valu):
+            return valu, {}
+
         if valu == '*':
             valu = s_common.guid()
             return valu, {}
 
-        valu = valu.lower()
-        if not s_common.isguid(valu):
-            raise s_exc.BadTypeValu(name=self.name, valu=valu,
-                                    mesg='valu is not a guid.')
-
-        return valu, {}
+        raise s_exc.BadTypeValu(name=self.name, valu=valu,
+                                mesg='valu is not a guid.')
 
 class Hex(Type):
 
@@ -720,8 +744,14 @@ class HugeNum(Type):
         maxv, maxfo = self.norm(valu[1])
         return ((cmpr, (minv, maxv), self.stortype),)
 
+def _mergeNewv(oldv, newv):
+    return newv
+
 class IntBase(Type):
 
+    # replaced by setMergeFunc() for types with ismin/ismax options
+    mergefunc = staticmethod(_mergeNewv)
+
     def __init__(self, modl, name, info, opts):
 
         Type.__init__(self, modl, name, info, opts)
@@ -740,6 +770,18 @@ class IntBase(Type):
             'range=': self._storLiftRange,
         })
 
+    def setMergeFunc(self, ismin, ismax):
+        '''
+        Select the value merge behavior once rather than on every merge.
+        '''
+        if ismin:
+            self.mergefunc = min
+        elif ismax:
+            self.mergefunc = max
+
+    def merge(self, oldv, newv):
+        return self.mergefunc(oldv, newv)
+
     def _storLiftRange(self, cmpr, valu):
         minv, minfo = self.norm(valu[0])
         maxv, maxfo = self.norm(valu[1])
@@ -839,20 +881,14 @@ class Int(IntBase):
             self.minval = max(minmin, minval)
             self.maxval = min(maxmax, maxval)
 
+        self.ismin = self.opts.get('ismin')
+        self.ismax = self.opts.get('ismax')
+        self.setMergeFunc(self.ismin, self.ismax)
+
         self.setNormFunc(str, self._normPyStr)
         self.setNormFunc(int, self._normPyInt)
         self.setNormFunc(bool, self._normPyBool)
 
-    def merge(self, oldv, newv):
-
-        if self.opts.get('ismin'):
-            return min(oldv, newv)
-
-        if self.opts.get('ismax'):
-            return max(oldv, newv)
-
-        return newv
-
     def _normPyStr(self, valu):
 
         if self.enumnorm:
@@ -872,11 +908,12 @@ class Int(IntBase):
 
     def _normPyInt(self, valu):
 
-        if self.minval is not None and valu < self.minval:
+        # minval and maxval are always resolved by postTypeInit()
+        if valu < self.minval:
             mesg = f'value is below min={self.minval}'
             raise s_exc.BadTypeValu(valu=valu, name=self.name, mesg=mesg)
 
-        if self.maxval is not None and valu > self.maxval:
+        if valu > self.maxval:
             mesg = f'value is above max={self.maxval}'
             raise s_exc.BadTypeValu(valu=valu, name=self.name, mesg=mesg)
 
@@ -1479,11 +1516,19 @@ class Str(Type):
         self.envals = None
         enumstr = self.opts.get('enums')
         if enumstr is not None:
-            self.envals = enumstr.split(',')
+            self.envals = frozenset(enumstr.split(','))
+
+        # hot-loop access to the norm and lift options
+        self.lower = self.opts.get('lower')
+        self.strip = self.opts.get('strip')
+        self.onespace = self.opts.get('onespace')
+        self.replace = self.opts.get('replace', ())
+        self.globsuffix = self.opts.get('globsuffix')
+        self.enumsinfo = self.info.get('enums')
 
     def _storLiftEq(self, cmpr, valu):
 
-        if self.opts.get('globsuffix') and valu.endswith('*'):
+        if self.globsuffix and valu.endswith('*'):
             return (
                 ('^=', valu[:-1], self.stortype),
             )
@@ -1500,17 +1545,17 @@ class Str(Type):
     def _normForLift(self, valu):
 
         # doesnt have to be normable...
-        if self.opts.get('lower'):
+        if self.lower:
             valu = valu.lower()
 
-        for look, repl in self.opts.get('replace', ()):
+        for look, repl in self.replace:
             valu = valu.replace(look, repl)
 
         # Only strip the left side of the string for prefix match
-        if self.opts.get('strip'):
+        if self.strip:
             valu = valu.lstrip()
 
-        if self.opts.get('onespace'):
+        if self.onespace:
             valu = s_chop.onespace(valu)
 
         return valu
@@ -1533,21 +1578,21 @@ class Str(Type):
         info = {}
         norm = str(valu)
 
-        if self.opts['lower']:
+        if self.lower:
             norm = norm.lower()
 
-        for look, repl in self.opts.get('replace', ()):
+        for look, repl in self.replace:
             norm = norm.replace(look, repl)
 
-        if self.opts['strip']:
+        if self.strip:
             norm = norm.strip()
 
-        if self.opts['onespace']:
+        if self.onespace:
             norm = s_chop.onespace(norm)
 
         if self.envals is not None:
             if norm not in self.envals:
-                raise s_exc.BadTypeValu(valu=valu, name=self.name, enums=self.info.get('enums'),
+                raise s_exc.BadTypeValu(valu=valu, name=self.name, enums=self.enumsinfo,
                                         mesg='Value not in enums')
 
         if self.regex is not None:
@@ -1584,7 +1629,7 @@ class Tag(Str):
                                     mesg=f'Tag does not match tagre: [{s_grammar.tagre.pattern}]')
 
         if len(toks) > 1:
-            subs['up'] = '.'.join(toks[:-1])
+            subs['up'] = norm.rpartition('.')[0]
 
         return norm, {'subs': subs}
 
@@ -1609,6 +1654,7 @@ class Time(IntBase):
 
         self.ismin = self.opts.get('ismin')
         self.ismax = self.opts.get('ismax')
+        self.setMergeFunc(self.ismin, self.ismax)
 
         self.storlifts.update({
             '@=': self._liftByIval,
@@ -1684,16 +1730,6 @@ class Time(IntBase):
             raise s_exc.BadTypeValu(mesg=mesg, valu=valu, name=self.name)
         return valu, {}
 
-    def merge(self, oldv, newv):
-
-        if self.ismin:
-            return min(oldv, newv)
-
-        if self.ismax:
-            return max(oldv, newv)
-
-        return newv
-
     def repr(self, valu):
 
         if valu == self.futsize:
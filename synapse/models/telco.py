@@ -25,6 +25,7 @@ class Phone(s_types.Str):
     def postTypeInit(self):
         s_types.Str.postTypeInit(self)
         self.opts['globsuffix'] = True
+        self.globsuffix = True
         self.setNormFunc(str, self._normPyStr)
         self.setNormFunc(int, self._normPyInt)
 
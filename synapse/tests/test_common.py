@@ -122,6 +122,15 @@ class CommonTest(s_t_utils.SynTest):
     def test_common_isguid(self):
         self.true(s_common.isguid('98db59098e385f0bfdec8a6a0a6118b3'))
         self.false(s_common.isguid('visi'))
+        self.false(s_common.isguid('98DB59098E385F0BFDEC8A6A0A6118B3'))
+        self.false(s_common.isguid('98db59098e385f0bfdec8a6a0a6118b3\n'))
+        self.false(s_common.isguid('98db59098e385f0bfdec8a6a0a6118bz'))
+
+    def test_common_base64(self):
+        byts = b'\x00\xffvisi'
+        text = s_common.enbase64(byts)
+        self.eq(text, 'AP92aXNp')
+        self.eq(byts, s_common.debase64(text))
 
     def test_common_chunks(self):
         s = '123456789'
@@ -20,6 +20,26 @@ class TypesTest(s_t_utils.SynTest):
         self.none(t.getCompOffs('newp'))
         self.raises(s_exc.NoSuchCmpr, t.cmpr, val1=1, name='newp', val2=0)
 
+    def test_type_normmany(self):
+        model = s_datamodel.Model()
+        t = model.type('bool')
+
+        self.eq(t.normMany(()), [])
+        self.eq(t.normMany((0, 'yes', 'off')), [(0, {}), (1, {}), (0, {})])
+        self.raises(s_exc.BadTypeValu, t.normMany, (1, 'newp'))
+
+        # array values and in= comparisons are normed via normMany()
+        arry = model.type('array').clone({'type': 'bool'})
+        self.eq((1, 0), arry.norm(('yes', 0))[0])
+        self.raises(s_exc.BadTypeValu, arry.norm, ('yes', 'newp'))
+
+        cmpr = t.getCmprCtor('in=')(('yes', 'off'))
+        self.true(cmpr(0))
+        self.true(cmpr(1))
+        cmpr = t.getCmprCtor('in=')(('yes',))
+        self.false(cmpr(0))
+        self.raises(s_exc.BadTypeValu, t.getCmprCtor('in='), ('yes', 'newp'))
+
     def test_bool(self):
         model = s_datamodel.Model()
         t = model.type('bool')
@@ -70,6 +70,9 @@ logger = logging.getLogger(__name__)
 # Default LMDB map size for tests
 TEST_MAP_SIZE = s_const.gibibyte
 
+# Directory containing the static test files
+TEST_FILES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'files')
+
 async def alist(coro):
     return [x async for x in coro]
 
@@ -1172,9 +1175,7 @@ class SynTest(unittest.TestCase):
             shutil.rmtree(tempdir, ignore_errors=True)
 
     def getTestFilePath(self, *names):
-        import synapse.tests.__init__
-        path = os.path.dirname(synapse.tests.__init__.__file__)
-        return os.path.join(path, 'files', *names)
+        return os.path.join(TEST_FILES_DIR, *names)
 
     @contextlib.contextmanager
     def getLoggerStream(self, logname, mesg=''):